@@ -1,23 +1,54 @@
-# The version of kgb
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class Version(NamedTuple):
+    """Information on a version of fabazon.
+
+    Version Added:
+        2.0
+    """
+
+    #: The major version number.
+    major: int
+
+    #: The minor version number.
+    minor: int
+
+    #: The micro version number.
+    micro: int
+
+    #: The release stage (``alpha``, ``beta``, ``rc``, or ``final``).
+    stage: str
+
+    #: The release number within the stage.
+    n: int
+
+    #: Whether this is a released version.
+    released: bool
+
+
+# The version of fabazon
 #
 # This is in the format of:
 #
 #   (Major, Minor, Micro, alpha/beta/rc/final, Release Number, Released)
 #
-VERSION = (0, 3, 1, 'final', 0, True)
+VERSION = Version(0, 3, 1, 'final', 0, True)
 
 
+@lru_cache(maxsize=1)
 def get_version_string():
-    version = '%s.%s' % (VERSION[0], VERSION[1])
+    version = '%s.%s' % (VERSION.major, VERSION.minor)
 
-    if VERSION[2]:
-        version += ".%s" % VERSION[2]
+    if VERSION.micro:
+        version += ".%s" % VERSION.micro
 
-    if VERSION[3] != 'final':
-        if VERSION[3] == 'rc':
-            version += ' RC%s' % VERSION[4]
+    if VERSION.stage != 'final':
+        if VERSION.stage == 'rc':
+            version += ' RC%s' % VERSION.n
         else:
-            version += ' %s %s' % (VERSION[3], VERSION[4])
+            version += ' %s %s' % (VERSION.stage, VERSION.n)
 
     if not is_release():
         version += " (dev)"
@@ -25,20 +56,21 @@ def get_version_string():
     return version
 
 
+@lru_cache(maxsize=1)
 def get_package_version():
-    version = '%s.%s' % (VERSION[0], VERSION[1])
+    version = '%s.%s' % (VERSION.major, VERSION.minor)
 
-    if VERSION[2]:
-        version += ".%s" % VERSION[2]
+    if VERSION.micro:
+        version += ".%s" % VERSION.micro
 
-    if VERSION[3] != 'final':
-        version += '%s%s' % (VERSION[3], VERSION[4])
+    if VERSION.stage != 'final':
+        version += '%s%s' % (VERSION.stage, VERSION.n)
 
     return version
 
 
 def is_release():
-    return VERSION[5]
+    return VERSION.released
 
 
 __version_info__ = VERSION[:-1]
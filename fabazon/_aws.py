@@ -0,0 +1,95 @@
+"""Shared AWS session and client management.
+
+Version Added:
+    2.0
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from functools import lru_cache
+from typing import Any
+
+from botocore.config import Config
+from botocore.session import Session
+
+
+#: The configuration used for all AWS clients.
+CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={
+        'mode': 'adaptive',
+    })
+
+
+#: A lock protecting client creation.
+#:
+#: Sessions are not thread-safe, so clients must be created one at a time.
+_client_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_session() -> Session:
+    """Return the shared AWS session.
+
+    The session uses the profile named in the ``FABAZON_AWS_PROFILE``
+    environment variable, if set.
+
+    This is a low-level botocore session. fabazon only uses low-level
+    client operations, so boto3's resource layer isn't needed.
+
+    Returns:
+        botocore.session.Session:
+        The shared session.
+    """
+    return Session(profile=os.environ.get('FABAZON_AWS_PROFILE'))
+
+
+def get_client(
+    service: str,
+    region: str,
+) -> Any:
+    """Return a shared AWS client for a service and region.
+
+    Clients are created once and reused, so they share credentials and
+    connection pools.
+
+    Args:
+        service (str):
+            The name of the AWS service.
+
+        region (str):
+            The region the client will connect to.
+
+    Returns:
+        botocore.client.BaseClient:
+        The client.
+    """
+    with _client_lock:
+        return _get_client(service, region)
+
+
+@lru_cache(maxsize=None)
+def _get_client(
+    service: str,
+    region: str,
+) -> Any:
+    """Create an AWS client for a service and region.
+
+    Callers must hold :py:data:`_client_lock`.
+
+    Args:
+        service (str):
+            The name of the AWS service.
+
+        region (str):
+            The region the client will connect to.
+
+    Returns:
+        botocore.client.BaseClient:
+        The new client.
+    """
+    return get_session().create_client(service,
+                                       region_name=region,
+                                       config=CLIENT_CONFIG)
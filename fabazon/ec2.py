@@ -2,21 +2,103 @@
 
 from __future__ import annotations
 
-import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http.client import HTTPException
 from typing import Any, Iterator, Mapping, Optional, Sequence
+from urllib.request import Request, urlopen
 
-import boto3
-
-from fabric.api import run
+from fabric.api import env, run
 from fabric.colors import red
 from typing_extensions import Self
 
+from fabazon._aws import get_client
+
+
+#: The base URL for the EC2 Instance Metadata Service.
+IMDS_URL = 'http://169.254.169.254/latest'
+
+#: Host names that refer to the machine running Fabric.
+LOCAL_HOSTS = {'localhost', '127.0.0.1', '::1'}
+
+#: A cache of instance IDs, keyed by Fabric host string.
+_instance_ids: dict[str, str] = {}
+
 
 def get_current_instance_id() -> Optional[str]:
     """Return the ID of the current EC2 host.
 
-    This will run a command on the currently-connected host and return the
-    resulting instance.
+    If the current Fabric host is the local machine, this will query the
+    EC2 Instance Metadata Service (IMDSv2) directly. Otherwise, or if that
+    fails, this will run a command on the currently-connected host and
+    return the resulting instance.
+
+    The result is cached for each Fabric host.
+
+    Version Changed:
+        2.0:
+        Added the local IMDSv2 lookup and per-host caching.
+
+    Returns:
+        str:
+        The EC2 instance ID, or ``None`` if it could not be determined.
+    """
+    host_string = env.host_string
+    instance_id = _instance_ids.get(host_string)
+
+    if instance_id is None:
+        if env.host in LOCAL_HOSTS:
+            instance_id = _get_local_instance_id()
+
+        if instance_id is None:
+            instance_id = _get_remote_instance_id()
+
+        if instance_id is not None:
+            _instance_ids[host_string] = instance_id
+
+    return instance_id
+
+
+def _get_local_instance_id() -> Optional[str]:
+    """Return the ID of the local EC2 instance using IMDSv2.
+
+    Version Added:
+        2.0
+
+    Returns:
+        str:
+        The EC2 instance ID, or ``None`` if the metadata service could not
+        be reached.
+    """
+    try:
+        token_request = Request(
+            f'{IMDS_URL}/api/token',
+            method='PUT',
+            headers={
+                'X-aws-ec2-metadata-token-ttl-seconds': '21600',
+            })
+
+        with urlopen(token_request, timeout=1) as rsp:
+            token = rsp.read().decode('utf-8')
+
+        instance_id_request = Request(
+            f'{IMDS_URL}/meta-data/instance-id',
+            headers={
+                'X-aws-ec2-metadata-token': token,
+            })
+
+        with urlopen(instance_id_request, timeout=1) as rsp:
+            return rsp.read().decode('utf-8').strip() or None
+    except (HTTPException, OSError, ValueError):
+        return None
+
+
+def _get_remote_instance_id() -> Optional[str]:
+    """Return the ID of the current EC2 host by running a command on it.
+
+    Version Added:
+        2.0
 
     Returns:
         str:
@@ -45,6 +127,14 @@ class EC2Instance:
     def for_current_host(cls) -> Optional[Self]:
         """Return an instance for the current Fabric host.
 
+        The instance ID is looked up once per Fabric host, and then cached
+        for the rest of the session. Call :py:meth:`clear_cache` to look it
+        up again.
+
+        Version Changed:
+            2.0:
+            Instance IDs are now cached per host.
+
         Returns:
             EC2Instance:
             The instance matching the host, or ``None`` if not found.
@@ -56,6 +146,18 @@ class EC2Instance:
 
         return cls(instance_id=instance_id)
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the cache of instance IDs for Fabric hosts.
+
+        Subsequent calls to :py:meth:`for_current_host` will look up the
+        instance ID again.
+
+        Version Added:
+            2.0
+        """
+        _instance_ids.clear()
+
     def __init__(
         self,
         *,
@@ -84,38 +186,71 @@ class EC2TagManager:
     #: The regions to scan.
     regions: Sequence[str]
 
+    #: The maximum number of instances to fetch per request.
+    #:
+    #: Version Added:
+    #:     2.0
+    page_size: int = 1000
+
     #: A mapping of regions to Boto EC2 client connections.
+    #:
+    #: Version Changed:
+    #:     2.0:
+    #:     Connections are now created when a region is first queried.
     region_cnx: dict[str, Any]
 
+    #: The number of seconds that instance lookups are cached.
+    #:
+    #: Version Added:
+    #:     2.0
+    ttl: float
+
+    #: A cache of instance lookups.
+    #:
+    #: This maps a ``(region, filters)`` key to a tuple of the time the
+    #: lookup was made and the resulting instances.
+    _cache: dict[tuple[Any, ...], tuple[float, list[Mapping[str, Any]]]]
+
+    #: The thread pool used to query multiple regions concurrently.
+    _executor: Optional[ThreadPoolExecutor]
+
     def __init__(
         self,
         *,
         regions: Sequence[str],
+        ttl: float = 30.0,
     ) -> None:
         """Initialize the tag manager.
 
         Version Changed:
             2.0:
-            Made ``regions`` a keyword-only argment.
+            * Made ``regions`` a keyword-only argment.
+            * Added the ``ttl`` argument.
 
         Args:
             regions (list of str):
                 The list of regions to scan.
-        """
-        self.regions = regions
-        self.region_cnx = {}
 
-        session = boto3.Session(
-            profile_name=os.environ.get('FABAZON_AWS_PROFILE'))
+            ttl (float, optional):
+                The number of seconds that instance lookups will be cached
+                before querying EC2 again.
 
-        for region in regions:
-            self.region_cnx[region] = session.client('ec2', region_name=region)
+                Version Added:
+                    2.0
+        """
+        # Duplicate regions would otherwise be queried (and returned) twice.
+        self.regions = list(dict.fromkeys(regions))
+        self.region_cnx = {}
+        self.ttl = ttl
+        self._cache = {}
+        self._executor = None
 
     def get_tagged_hostnames(
         self,
         *,
-        running_only: bool = True,
-        tags: Mapping[str, str],
+        running_only: Optional[bool] = None,
+        tags: Optional[Mapping[str, str]] = None,
+        filters: Optional[Sequence[Mapping[str, Any]]] = None,
     ) -> Sequence[str]:
         """Return the hostnames of all instances with the given tags.
 
@@ -127,34 +262,55 @@ class EC2TagManager:
             * Made ``running_only`` a keyword-only argument.
             * Made ``tags`` a keyword-only dictionary argument instead of
               passing as individual keyword arguments.
+            * Added the ``filters`` argument.
 
         Args:
             running_only (bool, optional):
                 Whether to return only running instances.
 
-            tags (dict, optional):
-                Any tags to filter by.
+                This defaults to ``True``. It can't be used with
+                ``filters``.
+
+            tags (dict):
+                The tags to filter by.
+
+                This is required unless ``filters`` is provided, and can't be
+                used with it.
+
+            filters (list of dict, optional):
+                Prebuilt EC2 filters from :py:meth:`build_filters`.
+
+                Version Added:
+                    2.0
 
         Returns:
             list of str:
             The list of hostnames matching the criteria.
-        """
-        hostnames: list[str] = []
 
-        for instance in self._filter_instances(running_only=running_only,
-                                               tags=tags):
-            dns_name = instance.get('PublicDnsName')
+        Raises:
+            TypeError:
+                Neither ``tags`` nor ``filters`` was provided.
 
-            if dns_name:
-                hostnames.append(dns_name)
-
-        return hostnames
+            ValueError:
+                ``filters`` was provided along with ``tags`` or
+                ``running_only``.
+        """
+        return [
+            instance['PublicDnsName']
+            for instance in self._filter_instances(
+                filters=self._get_filters(filters=filters,
+                                          running_only=running_only,
+                                          tags=tags,
+                                          tags_required=True))
+            if instance.get('PublicDnsName')
+        ]
 
     def get_tagged_instance_ids(
         self,
         *,
-        running_only: bool = True,
-        tags: Mapping[str, str],
+        running_only: Optional[bool] = None,
+        tags: Optional[Mapping[str, str]] = None,
+        filters: Optional[Sequence[Mapping[str, Any]]] = None,
     ) -> Sequence[str]:
         """Return the instance IDs of all instances with the given tags.
 
@@ -168,42 +324,189 @@ class EC2TagManager:
             running_only (bool, optional):
                 Whether to return only running instances.
 
-            tags (dict, optional):
-                Any tags to filter by.
+                This defaults to ``True``. It can't be used with
+                ``filters``.
+
+            tags (dict):
+                The tags to filter by.
+
+                This is required unless ``filters`` is provided, and can't be
+                used with it.
+
+            filters (list of dict, optional):
+                Prebuilt EC2 filters from :py:meth:`build_filters`.
 
         Returns:
             list of str:
             The list of instance IDs matching the criteria.
+
+        Raises:
+            TypeError:
+                Neither ``tags`` nor ``filters`` was provided.
+
+            ValueError:
+                ``filters`` was provided along with ``tags`` or
+                ``running_only``.
         """
         return [
             instance['InstanceId']
-            for instance in self._filter_instances(running_only=running_only,
-                                                   tags=tags)
+            for instance in self._filter_instances(
+                filters=self._get_filters(filters=filters,
+                                          running_only=running_only,
+                                          tags=tags,
+                                          tags_required=True))
         ]
 
-    def _filter_instances(
+    def get_tagged_hostnames_by_tag(
         self,
         *,
-        running_only: bool = True,
-        tags: Mapping[str, str],
-    ) -> Iterator[Mapping[str, Any]]:
-        """Iterate through all instances matching the given criteria.
+        tag_name: str,
+        running_only: Optional[bool] = None,
+        tags: Optional[Mapping[str, str]] = None,
+        filters: Optional[Sequence[Mapping[str, Any]]] = None,
+    ) -> dict[str, list[str]]:
+        """Return hostnames of tagged instances, grouped by a tag's value.
+
+        This performs a single lookup per region for all instances matching
+        ``tags``, and then groups the hostnames by the value of the
+        ``tag_name`` tag. Instances without that tag are not returned.
+
+        This is useful for building host lists for many roles at once.
 
         Version Added:
             2.0
 
         Args:
+            tag_name (str):
+                The name of the tag to group by.
+
             running_only (bool, optional):
                 Whether to return only running instances.
 
+                This defaults to ``True``. It can't be used with
+                ``filters``.
+
             tags (dict, optional):
                 Any tags to filter by.
 
-        Yields:
-            str:
-            Each instance matching the criteria.
+                This can't be used with ``filters``.
+
+            filters (list of dict, optional):
+                Prebuilt EC2 filters from :py:meth:`build_filters`.
+
+                These should only match instances with the ``tag_name``
+                tag set.
+
+        Returns:
+            dict:
+            A dictionary mapping each value of the tag to the list of
+            hostnames with that value.
+
+        Raises:
+            ValueError:
+                ``filters`` was provided along with ``tags`` or
+                ``running_only``.
+        """
+        return self._group_instances_by_tag(
+            key='PublicDnsName',
+            tag_name=tag_name,
+            filters=self._get_filters(filters=filters,
+                                      running_only=running_only,
+                                      tags=tags,
+                                      tag_keys=[tag_name]))
+
+    def get_tagged_instance_ids_by_tag(
+        self,
+        *,
+        tag_name: str,
+        running_only: Optional[bool] = None,
+        tags: Optional[Mapping[str, str]] = None,
+        filters: Optional[Sequence[Mapping[str, Any]]] = None,
+    ) -> dict[str, list[str]]:
+        """Return IDs of tagged instances, grouped by a tag's value.
+
+        This performs a single lookup per region for all instances matching
+        ``tags``, and then groups the instance IDs by the value of the
+        ``tag_name`` tag. Instances without that tag are not returned.
+
+        This is useful for building SSM host lists for many roles at once.
+
+        Version Added:
+            2.0
+
+        Args:
+            tag_name (str):
+                The name of the tag to group by.
+
+            running_only (bool, optional):
+                Whether to return only running instances.
+
+                This defaults to ``True``. It can't be used with
+                ``filters``.
+
+            tags (dict, optional):
+                Any tags to filter by.
+
+                This can't be used with ``filters``.
+
+            filters (list of dict, optional):
+                Prebuilt EC2 filters from :py:meth:`build_filters`.
+
+                These should only match instances with the ``tag_name``
+                tag set.
+
+        Returns:
+            dict:
+            A dictionary mapping each value of the tag to the list of
+            instance IDs with that value.
+
+        Raises:
+            ValueError:
+                ``filters`` was provided along with ``tags`` or
+                ``running_only``.
         """
-        tag_filter: list[dict[str, Any]] = [
+        return self._group_instances_by_tag(
+            key='InstanceId',
+            tag_name=tag_name,
+            filters=self._get_filters(filters=filters,
+                                      running_only=running_only,
+                                      tags=tags,
+                                      tag_keys=[tag_name]))
+
+    @staticmethod
+    def build_filters(
+        *,
+        running_only: bool = True,
+        tags: Mapping[str, str] = {},
+        tag_keys: Sequence[str] = [],
+    ) -> list[Mapping[str, Any]]:
+        """Return EC2 filters for the given criteria.
+
+        The result can be built once and passed as ``filters`` to the
+        lookup methods, avoiding rebuilding it on every lookup.
+
+        Version Added:
+            2.0
+
+        Args:
+            running_only (bool, optional):
+                Whether to match only running instances.
+
+            tags (dict, optional):
+                Any tags to filter by.
+
+            tag_keys (list of str, optional):
+                The names of any tags that must be set, regardless of value.
+
+        Returns:
+            list of dict:
+            The list of EC2 filters.
+        """
+        # We query DescribeInstances directly rather than going through the
+        # Resource Groups Tagging API. That API can't filter on instance
+        # state, and we'd still need DescribeInstances to resolve hostnames,
+        # so it would cost more calls per region rather than fewer.
+        filters: list[Mapping[str, Any]] = [
             {
                 'Name': f'tag:{key}',
                 'Values': [value],
@@ -211,11 +514,260 @@ class EC2TagManager:
             for key, value in tags.items()
         ]
 
-        for cnx in self.region_cnx.values():
-            response = cnx.describe_instances(Filters=tag_filter)
+        if tag_keys:
+            filters.append({
+                'Name': 'tag-key',
+                'Values': list(tag_keys),
+            })
+
+        if running_only:
+            filters.append({
+                'Name': 'instance-state-name',
+                'Values': ['running'],
+            })
+
+        return filters
+
+    def clear_cache(self) -> None:
+        """Clear the cache of instance lookups.
+
+        Subsequent lookups will query EC2 again.
 
-            for reservation in response['Reservations']:
-                for instance in reservation['Instances']:
-                    if (not running_only or
-                        instance['State']['Name'] == 'running'):
-                        yield instance
+        Version Added:
+            2.0
+        """
+        self._cache.clear()
+
+    def _get_filters(
+        self,
+        *,
+        filters: Optional[Sequence[Mapping[str, Any]]],
+        running_only: Optional[bool],
+        tags: Optional[Mapping[str, str]],
+        tags_required: bool = False,
+        tag_keys: Sequence[str] = [],
+    ) -> Sequence[Mapping[str, Any]]:
+        """Return prebuilt filters, or build them from the given criteria.
+
+        Version Added:
+            2.0
+
+        Args:
+            filters (list of dict):
+                Prebuilt EC2 filters, or ``None`` to build them.
+
+            running_only (bool):
+                Whether to match only running instances, or ``None`` for the
+                default of ``True``.
+
+            tags (dict):
+                Any tags to filter by.
+
+            tags_required (bool, optional):
+                Whether ``tags`` must be provided if ``filters`` isn't.
+
+            tag_keys (list of str, optional):
+                The names of any tags that must be set, regardless of value.
+
+        Returns:
+            list of dict:
+            The list of EC2 filters.
+
+        Raises:
+            TypeError:
+                ``tags_required`` was set, and neither ``tags`` nor
+                ``filters`` was provided.
+
+            ValueError:
+                ``filters`` was provided along with ``tags`` or
+                ``running_only``.
+        """
+        if filters is not None:
+            if tags is not None or running_only is not None:
+                raise ValueError(
+                    'filters cannot be combined with tags or running_only.')
+
+            return filters
+
+        if tags is None:
+            if tags_required:
+                raise TypeError('Either tags or filters must be provided.')
+
+            tags = {}
+
+        return self.build_filters(
+            running_only=running_only is None or running_only,
+            tags=tags,
+            tag_keys=tag_keys)
+
+    def _get_region_cnx(
+        self,
+        region: str,
+    ) -> Any:
+        """Return the EC2 client connection for a region.
+
+        The connection is created the first time it's needed.
+
+        Version Added:
+            2.0
+
+        Args:
+            region (str):
+                The region to connect to.
+
+        Returns:
+            botocore.client.BaseClient:
+            The EC2 client for the region.
+        """
+        try:
+            return self.region_cnx[region]
+        except KeyError:
+            cnx = get_client('ec2', region)
+            self.region_cnx[region] = cnx
+
+            return cnx
+
+    def _group_instances_by_tag(
+        self,
+        *,
+        key: str,
+        tag_name: str,
+        filters: Sequence[Mapping[str, Any]],
+    ) -> dict[str, list[str]]:
+        """Return values from matching instances, grouped by a tag's value.
+
+        Version Added:
+            2.0
+
+        Args:
+            key (str):
+                The key in each instance's information to collect.
+
+            tag_name (str):
+                The name of the tag to group by.
+
+            filters (list of dict):
+                The EC2 filters to query with.
+
+        Returns:
+            dict:
+            A dictionary mapping each value of the tag to the list of
+            collected values.
+        """
+        result: dict[str, list[str]] = {}
+
+        for instance in self._filter_instances(filters=filters):
+            value = instance.get(key)
+
+            if not value:
+                continue
+
+            for tag in instance.get('Tags') or []:
+                if tag['Key'] == tag_name:
+                    result.setdefault(tag['Value'], []).append(value)
+                    break
+
+        return result
+
+    def _filter_instances(
+        self,
+        *,
+        filters: Sequence[Mapping[str, Any]],
+    ) -> Iterator[Mapping[str, Any]]:
+        """Iterate through all instances matching the given filters.
+
+        When scanning multiple regions, the regions are queried concurrently.
+        Results for each region are cached for :py:attr:`ttl` seconds.
+
+        Version Added:
+            2.0
+
+        Args:
+            filters (list of dict):
+                The EC2 filters to query with, from :py:meth:`build_filters`.
+
+        Yields:
+            dict:
+            Each instance matching the filters.
+        """
+        get_instances = partial(
+            self._get_region_instances,
+            filters=filters,
+            filters_key=tuple(
+                (ec2_filter['Name'], tuple(ec2_filter['Values']))
+                for ec2_filter in filters
+            ))
+
+        if len(self.regions) > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self.regions),
+                    thread_name_prefix='fabazon-ec2')
+
+            results = self._executor.map(get_instances, self.regions)
+        else:
+            results = map(get_instances, self.regions)
+
+        for instances in results:
+            yield from instances
+
+    def _get_region_instances(
+        self,
+        region: str,
+        *,
+        filters: Sequence[Mapping[str, Any]],
+        filters_key: tuple[Any, ...],
+    ) -> list[Mapping[str, Any]]:
+        """Return all instances in a region matching the given filters.
+
+        All pages of results are fetched, :py:attr:`page_size` instances at a
+        time. Only the ``InstanceId``, ``PublicDnsName``, and ``Tags`` fields
+        of each instance are returned. Results are cached for :py:attr:`ttl`
+        seconds.
+
+        Version Added:
+            2.0
+
+        Args:
+            region (str):
+                The region to query.
+
+            filters (list of dict):
+                The EC2 filters to query with.
+
+            filters_key (tuple):
+                A hashable representation of the filters, for use in the
+                cache key.
+
+        Returns:
+            list of dict:
+            The list of instances matching the filters, containing only the
+            fields listed above.
+        """
+        cache_key = (region, filters_key)
+        cache_entry = self._cache.get(cache_key)
+
+        if (cache_entry is not None and
+            time.monotonic() - cache_entry[0] < self.ttl):
+            return cache_entry[1]
+
+        paginator = self._get_region_cnx(region).get_paginator(
+            'describe_instances')
+        pages = paginator.paginate(
+            Filters=filters,
+            PaginationConfig={
+                'PageSize': self.page_size,
+            })
+
+        # Flatten the reservations and keep only the fields we use, so the
+        # cache doesn't hold onto the rest of each instance's details.
+        instances: list[Mapping[str, Any]] = list(pages.search(
+            'Reservations[].Instances[].{'
+            'InstanceId: InstanceId, '
+            'PublicDnsName: PublicDnsName, '
+            'Tags: Tags'
+            '}'))
+
+        self._cache[cache_key] = (time.monotonic(), instances)
+
+        return instances
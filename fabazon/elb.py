@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import os
 import time
-from typing import Mapping, TYPE_CHECKING
+from typing import Callable, Mapping, Sequence, TYPE_CHECKING
 
-import boto3
 from fabric.colors import red
 
+from fabazon._aws import get_client
+
 if TYPE_CHECKING:
     from fabazon.ec2 import EC2Instance
 
@@ -20,6 +20,26 @@ class BaseLoadBalancer:
     It's otherwise a very thin base class.
     """
 
+    #: The maximum number of seconds to wait for an instance state change.
+    #:
+    #: Version Added:
+    #:     2.0
+    wait_timeout: float = 60.0
+
+    #: The initial delay in seconds between instance state checks.
+    #:
+    #: This doubles after each check, up to :py:attr:`max_wait_delay`.
+    #:
+    #: Version Added:
+    #:     2.0
+    initial_wait_delay: float = 0.5
+
+    #: The maximum delay in seconds between instance state checks.
+    #:
+    #: Version Added:
+    #:     2.0
+    max_wait_delay: float = 8.0
+
     def wait_until_instance_healthy(
         self,
         instance: EC2Instance,
@@ -29,6 +49,11 @@ class BaseLoadBalancer:
         This will wait up to 60 seconds for the instance to be marked as
         healthy by the load balancer, displaying an error if it times out.
 
+        Version Changed:
+            2.0:
+            The load balancer is now polled with an exponential backoff
+            rather than every second.
+
         Args:
             instance (fabazon.ec2.EC2Instance):
                 The instance to wait for.
@@ -38,15 +63,48 @@ class BaseLoadBalancer:
             ``True`` if the instance became healthy.
             ``False`` if it timed out waiting.
         """
-        # Wait for the instance to become healthy. We'll wait up to
-        # 60 seconds (+ request times).
-        for i in range(60):
-            if self.is_instance_healthy(instance):
-                return True
+        return self.wait_until_instances_healthy([instance])
+
+    def wait_until_instances_healthy(
+        self,
+        instances: Sequence[EC2Instance],
+    ) -> bool:
+        """Waits until all the given instances are healthy before returning.
+
+        This will wait up to 60 seconds for the instances to be marked as
+        healthy by the load balancer, displaying an error if it times out.
+        All pending instances are checked together on each poll.
+
+        Version Added:
+            2.0
+
+        Args:
+            instances (list of fabazon.ec2.EC2Instance):
+                The instances to wait for.
+
+        Returns:
+            bool:
+            ``True`` if all instances became healthy.
+            ``False`` if it timed out waiting.
+        """
+        pending = list(instances)
+
+        def _check() -> bool:
+            health = self.are_instances_healthy(pending)
+            pending[:] = [
+                instance
+                for instance in pending
+                if not health.get(instance.id)
+            ]
+
+            return not pending
 
-            time.sleep(1)
+        if self._wait_for(_check):
+            return True
 
-        print(red('Instance %s was not healthy after 60 seconds'))
+        print(red('Instances %s were not healthy after %d seconds'
+                  % (', '.join(instance.id for instance in pending),
+                     self.wait_timeout)))
         return False
 
     def wait_until_instance_removed(
@@ -58,6 +116,11 @@ class BaseLoadBalancer:
         This will wait up to 60 seconds for the instance to no longer be
         registered on the load balancer, displaying an error if it times out.
 
+        Version Changed:
+            2.0:
+            The load balancer is now polled with an exponential backoff
+            rather than every second.
+
         Args:
             instance (fabazon.ec2.EC2Instance):
                 The instance to wait for.
@@ -67,13 +130,48 @@ class BaseLoadBalancer:
             ``True`` if the instance was confirmed removed.
             ``False`` if it timed out waiting.
         """
-        for i in range(60):
-            if not self.is_instance_registered(instance):
-                return True
+        return self.wait_until_instances_removed([instance])
+
+    def wait_until_instances_removed(
+        self,
+        instances: Sequence[EC2Instance],
+    ) -> bool:
+        """Waits until all the given instances are removed before returning.
+
+        This will wait up to 60 seconds for the instances to no longer be
+        registered on the load balancer, displaying an error if it times out.
+        All pending instances are checked together on each poll.
+
+        Version Added:
+            2.0
 
-            time.sleep(1)
+        Args:
+            instances (list of fabazon.ec2.EC2Instance):
+                The instances to wait for.
+
+        Returns:
+            bool:
+            ``True`` if all instances were confirmed removed.
+            ``False`` if it timed out waiting.
+        """
+        pending = list(instances)
+
+        def _check() -> bool:
+            registered = self.are_instances_registered(pending)
+            pending[:] = [
+                instance
+                for instance in pending
+                if registered.get(instance.id, True)
+            ]
+
+            return not pending
 
-        print(red('Instance %s was still registered after 60 seconds'))
+        if self._wait_for(_check):
+            return True
+
+        print(red('Instances %s were still registered after %d seconds'
+                  % (', '.join(instance.id for instance in pending),
+                     self.wait_timeout)))
         return False
 
     def register_instance(
@@ -100,6 +198,44 @@ class BaseLoadBalancer:
         """
         raise NotImplementedError
 
+    def register_instances(
+        self,
+        instances: Sequence[EC2Instance],
+    ) -> None:
+        """Register several instances on the load balancer.
+
+        By default, this registers each instance individually. Subclasses
+        can override this to register all instances in a single request.
+
+        Version Added:
+            2.0
+
+        Args:
+            instances (list of fabazon.ec2.EC2Instance):
+                The instances to register.
+        """
+        for instance in instances:
+            self.register_instance(instance)
+
+    def unregister_instances(
+        self,
+        instances: Sequence[EC2Instance],
+    ) -> None:
+        """Unregister several instances from the load balancer.
+
+        By default, this unregisters each instance individually. Subclasses
+        can override this to unregister all instances in a single request.
+
+        Version Added:
+            2.0
+
+        Args:
+            instances (list of fabazon.ec2.EC2Instance):
+                The instances to unregister.
+        """
+        for instance in instances:
+            self.unregister_instance(instance)
+
     def is_instance_registered(
         self,
         instance: EC2Instance,
@@ -134,6 +270,95 @@ class BaseLoadBalancer:
         """
         raise NotImplementedError
 
+    def are_instances_registered(
+        self,
+        instances: Sequence[EC2Instance],
+    ) -> Mapping[str, bool]:
+        """Return whether each of the given instances is registered.
+
+        By default, this checks each instance individually. Subclasses can
+        override this to check all instances in a single request.
+
+        Version Added:
+            2.0
+
+        Args:
+            instances (list of fabazon.ec2.EC2Instance):
+                The instances to check.
+
+        Returns:
+            dict:
+            A dictionary mapping instance IDs to whether they're registered.
+        """
+        return {
+            instance.id: self.is_instance_registered(instance)
+            for instance in instances
+        }
+
+    def are_instances_healthy(
+        self,
+        instances: Sequence[EC2Instance],
+    ) -> Mapping[str, bool]:
+        """Return whether each of the given instances is healthy.
+
+        By default, this checks each instance individually. Subclasses can
+        override this to check all instances in a single request.
+
+        Version Added:
+            2.0
+
+        Args:
+            instances (list of fabazon.ec2.EC2Instance):
+                The instances to check.
+
+        Returns:
+            dict:
+            A dictionary mapping instance IDs to whether they're healthy.
+        """
+        return {
+            instance.id: self.is_instance_healthy(instance)
+            for instance in instances
+        }
+
+    def _wait_for(
+        self,
+        check: Callable[[], bool],
+    ) -> bool:
+        """Wait until a check passes, backing off between attempts.
+
+        The check is called immediately, and then after delays starting at
+        :py:attr:`initial_wait_delay` and doubling up to
+        :py:attr:`max_wait_delay`, until :py:attr:`wait_timeout` seconds
+        have passed.
+
+        Version Added:
+            2.0
+
+        Args:
+            check (callable):
+                The function to call. This should return ``True`` once the
+                condition being waited on has been met.
+
+        Returns:
+            bool:
+            ``True`` if the check passed.
+            ``False`` if it timed out waiting.
+        """
+        deadline = time.monotonic() + self.wait_timeout
+        delay = self.initial_wait_delay
+
+        while True:
+            if check():
+                return True
+
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                return False
+
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.max_wait_delay)
+
 
 class LoadBalancerV2(BaseLoadBalancer):
     """A modern AWS load balancer supporting ALB and NLB.
@@ -166,9 +391,7 @@ class LoadBalancerV2(BaseLoadBalancer):
         """
         self.target_group_arn = target_group_arn
 
-        session = boto3.Session(
-            profile_name=os.environ.get('FABAZON_AWS_PROFILE'))
-        self._cnx = session.client('elbv2', region_name=region)
+        self._cnx = get_client('elbv2', region)
 
     def register_instance(
         self,
@@ -180,11 +403,31 @@ class LoadBalancerV2(BaseLoadBalancer):
             instance (fabazon.ec2.EC2Instance):
                 The instance to register.
         """
+        self.register_instances([instance])
+
+    def register_instances(
+        self,
+        instances: Sequence[EC2Instance],
+    ) -> None:
+        """Register several instances on the load balancer.
+
+        All instances are registered in a single request.
+
+        Version Added:
+            2.0
+
+        Args:
+            instances (list of fabazon.ec2.EC2Instance):
+                The instances to register.
+        """
         self._cnx.register_targets(
             TargetGroupArn=self.target_group_arn,
-            Targets=[{
-                'Id': instance.id,
-            }])
+            Targets=[
+                {
+                    'Id': instance.id,
+                }
+                for instance in instances
+            ])
 
     def unregister_instance(
         self,
@@ -196,11 +439,31 @@ class LoadBalancerV2(BaseLoadBalancer):
             instance (fabazon.ec2.EC2Instance):
                 The instance to unregister.
         """
+        self.unregister_instances([instance])
+
+    def unregister_instances(
+        self,
+        instances: Sequence[EC2Instance],
+    ) -> None:
+        """Unregister several instances from the load balancer.
+
+        All instances are unregistered in a single request.
+
+        Version Added:
+            2.0
+
+        Args:
+            instances (list of fabazon.ec2.EC2Instance):
+                The instances to unregister.
+        """
         self._cnx.deregister_targets(
             TargetGroupArn=self.target_group_arn,
-            Targets=[{
-                'Id': instance.id,
-            }])
+            Targets=[
+                {
+                    'Id': instance.id,
+                }
+                for instance in instances
+            ])
 
     def is_instance_registered(
         self,
@@ -217,9 +480,7 @@ class LoadBalancerV2(BaseLoadBalancer):
             ``True`` if the instance is registered on the load balancer.
             ``False`` if it's not registered.
         """
-        health_info = self._get_instance_health_info(instance)
-
-        return health_info.get('Reason') != 'Target.NotRegistered'
+        return self._is_registered(self._get_instance_health_infos(instance))
 
     def is_instance_healthy(
         self,
@@ -236,32 +497,165 @@ class LoadBalancerV2(BaseLoadBalancer):
             ``True`` if the instance is healthy.
             ``False`` if it's not healthy.
         """
-        health_info = self._get_instance_health_info(instance)
+        return self._is_healthy(self._get_instance_health_infos(instance))
+
+    def are_instances_healthy(
+        self,
+        instances: Sequence[EC2Instance],
+    ) -> Mapping[str, bool]:
+        """Return whether each of the given instances is healthy.
+
+        All instances are checked in a single request.
+
+        Version Added:
+            2.0
+
+        Args:
+            instances (list of fabazon.ec2.EC2Instance):
+                The instances to check.
+
+        Returns:
+            dict:
+            A dictionary mapping instance IDs to whether they're healthy.
+        """
+        health_infos = self._get_health_infos_bulk(instances)
 
-        return health_info['State'] == 'healthy'
+        return {
+            instance.id: self._is_healthy(health_infos.get(instance.id, []))
+            for instance in instances
+        }
 
-    def _get_instance_health_info(
+    def are_instances_registered(
+        self,
+        instances: Sequence[EC2Instance],
+    ) -> Mapping[str, bool]:
+        """Return whether each of the given instances is registered.
+
+        All instances are checked in a single request.
+
+        Version Added:
+            2.0
+
+        Args:
+            instances (list of fabazon.ec2.EC2Instance):
+                The instances to check.
+
+        Returns:
+            dict:
+            A dictionary mapping instance IDs to whether they're registered.
+        """
+        health_infos = self._get_health_infos_bulk(instances)
+
+        return {
+            instance.id: self._is_registered(health_infos.get(instance.id, []))
+            for instance in instances
+        }
+
+    def _get_instance_health_infos(
         self,
         instance: EC2Instance,
-    ) -> Mapping[str, str]:
+    ) -> Sequence[Mapping[str, str]]:
         """Return health information for an instance.
 
+        An instance registered on several ports has one entry per port.
+
+        Version Changed:
+            2.0:
+            This now returns a list of entries, and was renamed from
+            ``_get_instance_health_info``.
+
         Args:
             instance (fabazon.ec2.EC2Instance):
                 The instance to check.
 
+        Returns:
+            list of dict:
+            Information on the instance's health for each registration.
+        """
+        return self._get_health_infos_bulk([instance]).get(instance.id, [])
+
+    def _get_health_infos_bulk(
+        self,
+        instances: Sequence[EC2Instance],
+    ) -> Mapping[str, Sequence[Mapping[str, str]]]:
+        """Return health information for several instances.
+
+        All instances are checked in a single request. An instance registered
+        on several ports has one entry per port.
+
+        Version Added:
+            2.0
+
+        Args:
+            instances (list of fabazon.ec2.EC2Instance):
+                The instances to check.
+
         Returns:
             dict:
-            Information on the instance's health.
+            A dictionary mapping instance IDs to lists of information on each
+            registration's health.
         """
         rsp = self._cnx.describe_target_health(
             TargetGroupArn=self.target_group_arn,
-            Targets=[{
-                'Id': instance.id,
-            }])
+            Targets=[
+                {
+                    'Id': instance.id,
+                }
+                for instance in instances
+            ])
+
+        health_infos: dict[str, list[Mapping[str, str]]] = {}
+
+        for health_info in rsp['TargetHealthDescriptions']:
+            health_infos.setdefault(health_info['Target']['Id'], []).append(
+                health_info['TargetHealth'])
+
+        return health_infos
+
+    @staticmethod
+    def _is_healthy(
+        health_infos: Sequence[Mapping[str, str]],
+    ) -> bool:
+        """Return whether all of an instance's registrations are healthy.
+
+        Version Added:
+            2.0
+
+        Args:
+            health_infos (list of dict):
+                Information on the health of each of the instance's
+                registrations.
 
-        health_info = rsp['TargetHealthDescriptions']
-        assert len(health_info) == 1
-        assert health_info[0]['Target']['Id'] == instance.id
+        Returns:
+            bool:
+            ``True`` if there's at least one registration and all are
+            healthy. ``False`` otherwise.
+        """
+        return bool(health_infos) and all(
+            health_info['State'] == 'healthy'
+            for health_info in health_infos
+        )
+
+    @staticmethod
+    def _is_registered(
+        health_infos: Sequence[Mapping[str, str]],
+    ) -> bool:
+        """Return whether any of an instance's registrations are active.
+
+        Version Added:
+            2.0
 
-        return health_info[0]['TargetHealth']
+        Args:
+            health_infos (list of dict):
+                Information on the health of each of the instance's
+                registrations.
+
+        Returns:
+            bool:
+            ``True`` if any registration is still registered.
+            ``False`` otherwise.
+        """
+        return any(
+            health_info.get('Reason') != 'Target.NotRegistered'
+            for health_info in health_infos
+        )
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Mapping, Optional, Sequence
+from functools import cached_property
+from typing import Any, Mapping, Optional, Sequence
 
 from fabazon.ec2 import EC2TagManager
 
@@ -22,6 +23,12 @@ class EC2RoleDefs(dict[str, Optional[Sequence[str]]]):
     # Instance variables #
     ######################
 
+    #: The regions to scan.
+    #:
+    #: Version Added:
+    #:     2.0
+    regions: Sequence[str]
+
     #: The tags to require for any matches.
     require_tags: Mapping[str, str]
 
@@ -31,12 +38,14 @@ class EC2RoleDefs(dict[str, Optional[Sequence[str]]]):
     #: The list of roles to scan.
     roles: Sequence[str]
 
-    #: The associated EC2 tag manager.
-    tag_manager: EC2TagManager
-
     #: Whether to use SSM support.
     use_ssm: bool
 
+    #: The EC2 filters used to look up the hosts for all roles.
+    #:
+    #: These match only instances whose role tag is one of :py:attr:`roles`.
+    _roles_filters: Sequence[Mapping[str, Any]]
+
     def __init__(
         self,
         *,
@@ -45,14 +54,17 @@ class EC2RoleDefs(dict[str, Optional[Sequence[str]]]):
         role_tag: str = 'role',
         require_tags: Mapping[str, str] = {},
         use_ssm: bool = False,
+        prefetch: bool = False,
     ) -> None:
         """Initialize the role definitions.
 
-        This will pre-populate the dictionary, mapping all roles to ``None``.
+        This will pre-populate the dictionary, mapping all roles to ``None``,
+        or to the list of hosts if ``prefetch`` is set.
 
         Version Changed:
             * Made all arguments keyword-only arguments.
             * Added SSM support via the ``use_ssm`` argument.
+            * Added the ``prefetch`` argument.
 
         Args:
             regions (list of str):
@@ -73,21 +85,49 @@ class EC2RoleDefs(dict[str, Optional[Sequence[str]]]):
                 If set, this dictionary will map to EC2 identifiers rather
                 than hostnames.
 
+                Version Added:
+                    2.0
+
+            prefetch (bool, optional):
+                Whether to look up the hosts for all roles immediately,
+                rather than on first access.
+
                 Version Added:
                     2.0
         """
         super().__init__()
 
-        self.tag_manager = EC2TagManager(regions=regions)
-
+        self.regions = regions
         self.role_tag = role_tag
         self.require_tags = require_tags
         self.roles = roles
         self.use_ssm = use_ssm
+        self._roles_filters = [
+            *EC2TagManager.build_filters(tags=require_tags),
+            {
+                'Name': f'tag:{role_tag}',
+                'Values': list(roles),
+            },
+        ]
 
         for role in roles:
             self[role] = None
 
+        if prefetch and roles:
+            self._load_roles()
+
+    @cached_property
+    def tag_manager(self) -> EC2TagManager:
+        """The associated EC2 tag manager.
+
+        This is created the first time it's needed.
+
+        Version Changed:
+            2.0:
+            This is now created on first access.
+        """
+        return EC2TagManager(regions=self.regions)
+
     def __getitem__(
         self,
         role: str,
@@ -105,16 +145,44 @@ class EC2RoleDefs(dict[str, Optional[Sequence[str]]]):
         result = super().__getitem__(role)
 
         if result is None:
-            tags: dict[str, str] = {
-                self.role_tag: role,
-            }
-            tags.update(self.require_tags)
-
-            if self.use_ssm:
-                result = self.tag_manager.get_tagged_instance_ids(tags=tags)
+            if role in self.roles:
+                self._load_roles()
+                result = super().__getitem__(role)
             else:
-                result = self.tag_manager.get_tagged_hostnames(tags=tags)
+                tags: dict[str, str] = {
+                    self.role_tag: role,
+                }
+                tags.update(self.require_tags)
 
-            self[role] = result
+                if self.use_ssm:
+                    result = self.tag_manager.get_tagged_instance_ids(
+                        tags=tags)
+                else:
+                    result = self.tag_manager.get_tagged_hostnames(tags=tags)
+
+                self[role] = result
 
         return result
+
+    def _load_roles(self) -> None:
+        """Load the hosts for all configured roles.
+
+        This performs a single lookup per region for all instances matching
+        the required tags, and then populates every role in :py:attr:`roles`
+        with the results. Roles without any matching instances are set to
+        an empty list.
+
+        Version Added:
+            2.0
+        """
+        if self.use_ssm:
+            by_role = self.tag_manager.get_tagged_instance_ids_by_tag(
+                tag_name=self.role_tag,
+                filters=self._roles_filters)
+        else:
+            by_role = self.tag_manager.get_tagged_hostnames_by_tag(
+                tag_name=self.role_tag,
+                filters=self._roles_filters)
+
+        for role in self.roles:
+            self[role] = by_role.get(role, [])